@@ -1,7 +1,13 @@
 """Calculate statistics over the sections appearing in article abstracts."""
 
+import csv
+import functools
+import gzip
+import heapq
 import textwrap
-from collections import Counter
+from collections import Counter, defaultdict
+from itertools import islice
+from operator import itemgetter
 
 import click
 import pystow
@@ -9,13 +15,16 @@ from tabulate import tabulate
 
 from pubmed_downloader import iterate_process_articles
 
-DOCUMENT_SECTION_TSV_PATH = pystow.join("pubmed", name="document-sections.tsv")
+DOCUMENT_SECTION_TSV_PATH = pystow.join("pubmed", name="document-sections.tsv.gz")
 
 
+@functools.cache
 def _normalize(s: str) -> str:
     s = s.strip()
     s = s.replace(" & ", "and")
-    s = s.lower()
+    # casefold rather than lower so surprise capitalizations from the
+    # raw labels collapse onto the enumerated variants
+    s = s.casefold()
     return s
 
 
@@ -171,46 +180,91 @@ CATEGORY_TO_LABELS = {
         "unlabelled",
     },
 }
-RELABELING = {_normalize(value): k for k, values in CATEGORY_TO_LABELS.items() for value in values}
+
+
+def _build_relabeling() -> dict[str, str | None]:
+    """Normalize all label variants, checking that no two categories collide."""
+    rv: dict[str, str | None] = {}
+    for category, labels in CATEGORY_TO_LABELS.items():
+        for label in labels:
+            normalized = _normalize(label)
+            if rv.setdefault(normalized, category) != category:
+                raise ValueError(
+                    f"label {label!r} normalizes to {normalized!r}, which is "
+                    f"mapped to both {rv[normalized]!r} and {category!r}"
+                )
+    return rv
+
+
+RELABELING = _build_relabeling()
+#: Exact raw spellings, checked before paying for normalization since
+#: most labels arrive as one of the spellings already enumerated above
+EXACT_RELABELING = {value: k for k, values in CATEGORY_TO_LABELS.items() for value in values}
+
+#: Sentinel distinguishing a missing label from one relabeled to ``None``
+_UNMATCHED = object()
 
 
 def main() -> None:
     """Calculate stats."""
-    label_counter: Counter[tuple[str, bool]] = Counter()
+    # two scalar-keyed counters are cheaper to update than a single
+    # counter over (label, matched) tuples, which re-hashes both members.
+    # defaultdict(int) has a cheaper __missing__ than Counter for the
+    # one-at-a-time increments below
+    matched_counter: defaultdict[str | None, int] = defaultdict(int)
+    unmatched_counter: defaultdict[str, int] = defaultdict(int)
     category_counter: Counter[str] = Counter()
 
     n = None
-    it = iterate_process_articles(source="local", ground=False)
+    it = iterate_process_articles(source="local", ground=False, multiprocessing=True)
     if n is not None:
-        it = (article for article, _ in zip(it, range(n), strict=False))
+        it = islice(it, n)
 
+    # bind the lookups to locals; inside the per-text loop these run
+    # tens of millions of times and each global/attribute resolution
+    # costs a dict lookup of its own
+    exact_get = EXACT_RELABELING.get
+    relabel_get = RELABELING.get
     for article in it:
         for t in article.abstract:
-            if t.label:
-                label = _normalize(t.label)
-                if label in RELABELING:
-                    label_counter[RELABELING[label], True] += 1
+            if label := t.label:
+                relabeled = exact_get(label, _UNMATCHED)
+                if relabeled is _UNMATCHED:
+                    normalized = _normalize(label)
+                    relabeled = relabel_get(normalized, _UNMATCHED)
+                    if relabeled is _UNMATCHED:
+                        unmatched_counter[normalized] += 1
+                    else:
+                        matched_counter[relabeled] += 1
                 else:
-                    label_counter[label, False] += 1
-            if t.category:
-                category_counter[t.category] += 1
+                    matched_counter[relabeled] += 1
+            if category := t.category:
+                category_counter[category] += 1
+
+    rows = [(label, True, count) for label, count in matched_counter.items()]
+    rows.extend((label, False, count) for label, count in unmatched_counter.items())
 
+    # the display only shows the head of the distribution, so pick the
+    # top rows with a heap instead of sorting all distinct labels
     click.echo("Label Counter")
     click.echo(
         tabulate(
             [
-                (textwrap.shorten(a, 40), b, count)
-                for (a, b), count in label_counter.most_common()
+                (textwrap.shorten(label, 40), matched, count)
+                for label, matched, count in heapq.nlargest(100, rows, key=itemgetter(2))
                 if count > 1_000
             ]
         )
     )
-    with DOCUMENT_SECTION_TSV_PATH.open("w") as file:
-        for (a, b), c in label_counter.most_common():
-            print(a, b, c, sep="\t", file=file)
+    rows.sort(key=itemgetter(2), reverse=True)
+    with gzip.open(DOCUMENT_SECTION_TSV_PATH, "wt", compresslevel=3) as file:
+        csv.writer(file, delimiter="\t", lineterminator="\n").writerows(rows)
 
+    # stream the top categories row by row instead of building one big
+    # tabulate string over the full (potentially large) counter
     click.echo("\nCategory Counter")
-    click.echo(tabulate(category_counter.most_common()))
+    for category, count in category_counter.most_common(100):
+        click.echo(f"{category}\t{count}")
 
 
 if __name__ == "__main__":
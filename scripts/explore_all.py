@@ -0,0 +1,95 @@
+"""Run all three explorations over a single pass of the articles.
+
+Running explore_grants.py, explore_document_types.py, and
+explore_abstract_sections.py separately sweeps the local PubMed mirror
+once per script. The three read disjoint fields of the same articles,
+so this driver consumes the iterator once, updates every counter, and
+writes all the TSVs at the end.
+"""
+
+import csv
+import gzip
+import sys
+from collections import Counter, defaultdict
+from operator import itemgetter
+
+import pyobo
+from explore_abstract_sections import (
+    _UNMATCHED,
+    DOCUMENT_SECTION_TSV_PATH,
+    EXACT_RELABELING,
+    RELABELING,
+    _normalize,
+)
+from explore_document_types import DOCUMENT_TYPES_TSV_PATH
+from explore_grants import AGENCY_TSV_PATH, GRANTS_TSV_PATH
+
+from pubmed_downloader import iterate_process_articles
+
+
+def main() -> None:
+    """Explore grants, document types, and abstract sections in one sweep."""
+    agency_counter: Counter[str] = Counter()
+    ids_counter: Counter[tuple[str, str | None]] = Counter()
+    examples: dict[str, str] = {}
+    article_type_counter: Counter[str] = Counter()
+    matched_counter: defaultdict[str | None, int] = defaultdict(int)
+    unmatched_counter: defaultdict[str, int] = defaultdict(int)
+    category_counter: Counter[str] = Counter()
+
+    exact_get = EXACT_RELABELING.get
+    relabel_get = RELABELING.get
+    for article in iterate_process_articles(source="local", ground=False, multiprocessing=True):
+        for grant in article.grants:
+            agency, grant_id = sys.intern(grant.agency), grant.id
+            agency_counter[agency] += 1
+            ids_counter[agency, grant_id] += 1
+            if grant_id and agency not in examples:
+                examples[agency] = grant_id
+
+        article_type_counter.update(sys.intern(x) for x in article.type_mesh_ids if x)
+
+        for t in article.abstract:
+            if label := t.label:
+                relabeled = exact_get(label, _UNMATCHED)
+                if relabeled is _UNMATCHED:
+                    normalized = _normalize(label)
+                    relabeled = relabel_get(normalized, _UNMATCHED)
+                    if relabeled is _UNMATCHED:
+                        unmatched_counter[normalized] += 1
+                    else:
+                        matched_counter[relabeled] += 1
+                else:
+                    matched_counter[relabeled] += 1
+            if category := t.category:
+                category_counter[category] += 1
+
+    with gzip.open(AGENCY_TSV_PATH, "wt", compresslevel=3) as file:
+        writer = csv.writer(file, delimiter="\t", lineterminator="\n")
+        writer.writerows(
+            (agency, count, examples.get(agency) or "")
+            for agency, count in agency_counter.most_common()
+        )
+
+    with gzip.open(GRANTS_TSV_PATH, "wt", compresslevel=3) as file:
+        writer = csv.writer(file, delimiter="\t", lineterminator="\n")
+        writer.writerows(
+            (agency, grant_id, count) for (agency, grant_id), count in ids_counter.most_common()
+        )
+
+    mesh_names = pyobo.get_id_name_mapping("mesh")
+    with gzip.open(DOCUMENT_TYPES_TSV_PATH, "wt", compresslevel=3) as file:
+        csv.writer(file, delimiter="\t", lineterminator="\n").writerows(
+            (mesh_id, mesh_names.get(mesh_id), count)
+            for mesh_id, count in article_type_counter.most_common()
+        )
+
+    rows = [(label, True, count) for label, count in matched_counter.items()]
+    rows.extend((label, False, count) for label, count in unmatched_counter.items())
+    rows.sort(key=itemgetter(2), reverse=True)
+    with gzip.open(DOCUMENT_SECTION_TSV_PATH, "wt", compresslevel=3) as file:
+        csv.writer(file, delimiter="\t", lineterminator="\n").writerows(rows)
+
+
+if __name__ == "__main__":
+    main()
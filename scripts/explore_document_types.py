@@ -1,6 +1,10 @@
 """Calculate statistics over the document types."""
 
+import csv
+import gzip
+import sys
 from collections import Counter
+from itertools import islice
 
 import click
 import pyobo
@@ -9,35 +13,33 @@ from tabulate import tabulate
 
 from pubmed_downloader import iterate_process_articles
 
-DOCUMENT_TYPES_TSV_PATH = pystow.join("pubmed", name="document-types.tsv")
+DOCUMENT_TYPES_TSV_PATH = pystow.join("pubmed", name="document-types.tsv.gz")
 
 
 def main() -> None:
     """Calculate stats."""
-    pyobo.get_name("mesh", "D016441")
     article_type_counter: Counter[str] = Counter()
 
     n = None
-    it = iterate_process_articles(source="local", ground=False)
+    it = iterate_process_articles(source="local", ground=False, multiprocessing=True)
     if n is not None:
-        it = (article for article, _ in zip(it, range(n), strict=False))
+        it = islice(it, n)
 
     for article in it:
-        for x in article.type_mesh_ids:
-            if not x:
-                continue
-            article_type_counter[x] += 1
+        article_type_counter.update(sys.intern(x) for x in article.type_mesh_ids if x)
 
+    # resolve all names through one bulk mapping instead of a pyobo
+    # lookup per unique MeSH identifier
+    mesh_names = pyobo.get_id_name_mapping("mesh")
     rows = [
-        (mesh_id, pyobo.get_name("mesh", mesh_id), count)
+        (mesh_id, mesh_names.get(mesh_id), count)
         for mesh_id, count in article_type_counter.most_common()
     ]
 
     click.echo("Document Type Counter")
     click.echo(tabulate(rows))
-    with DOCUMENT_TYPES_TSV_PATH.open("w") as file:
-        for mesh_id, name, count in rows:
-            print(mesh_id, name, count, sep="\t", file=file)
+    with gzip.open(DOCUMENT_TYPES_TSV_PATH, "wt", compresslevel=3) as file:
+        csv.writer(file, delimiter="\t", lineterminator="\n").writerows(rows)
 
 
 if __name__ == "__main__":
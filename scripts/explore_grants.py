@@ -7,14 +7,17 @@ The purpose here is to identify new/existing Bioregistry
 prefixes for different grant agencies.
 """
 
+import csv
+import gzip
+import sys
 from collections import Counter
 
 import pystow
 
 from pubmed_downloader import iterate_process_articles
 
-GRANTS_TSV_PATH = pystow.join("pubmed", name="grants.tsv")
-AGENCY_TSV_PATH = pystow.join("pubmed", name="agencies.tsv")
+GRANTS_TSV_PATH = pystow.join("pubmed", name="grants.tsv.gz")
+AGENCY_TSV_PATH = pystow.join("pubmed", name="agencies.tsv.gz")
 
 
 def main() -> None:
@@ -22,20 +25,28 @@ def main() -> None:
     ids_counter = Counter()
     agency_counter = Counter()
     examples = {}
-    for article in iterate_process_articles(source="local"):
+    for article in iterate_process_articles(source="local", ground=False, multiprocessing=True):
+        # bind the attributes to locals once per grant instead of paying
+        # an attribute lookup per counter
         for grant in article.grants:
-            agency_counter[grant.agency] += 1
-            ids_counter[grant.agency, grant.id] += 1
-            if grant.agency not in examples and grant.id:
-                examples[grant.agency] = grant.id
-
-    with AGENCY_TSV_PATH.open("w") as file:
-        for agency, count in agency_counter.most_common():
-            print(agency, count, examples.get(agency) or "", file=file, sep="\t")
-
-    with GRANTS_TSV_PATH.open("w") as file:
-        for (agency, grant_id), count in ids_counter.most_common():
-            print(agency, grant_id, count, file=file, sep="\t")
+            agency, grant_id = sys.intern(grant.agency), grant.id
+            agency_counter[agency] += 1
+            ids_counter[agency, grant_id] += 1
+            if grant_id and agency not in examples:
+                examples[agency] = grant_id
+
+    with gzip.open(AGENCY_TSV_PATH, "wt", compresslevel=3) as file:
+        writer = csv.writer(file, delimiter="\t", lineterminator="\n")
+        writer.writerows(
+            (agency, count, examples.get(agency) or "")
+            for agency, count in agency_counter.most_common()
+        )
+
+    with gzip.open(GRANTS_TSV_PATH, "wt", compresslevel=3) as file:
+        writer = csv.writer(file, delimiter="\t", lineterminator="\n")
+        writer.writerows(
+            (agency, grant_id, count) for (agency, grant_id), count in ids_counter.most_common()
+        )
 
 
 if __name__ == "__main__":
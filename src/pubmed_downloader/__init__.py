@@ -1,42 +1,46 @@
 """Automate downloading and processing PubMed."""
 
-from .api import (
-    AbstractText,
-    Article,
-    Journal,
-    ensure_baselines,
-    ensure_updates,
-    iterate_ensure_articles,
-    iterate_ensure_baselines,
-    iterate_ensure_updates,
-    iterate_process_articles,
-    iterate_process_baselines,
-    iterate_process_updates,
-    process_articles,
-    process_baselines,
-    process_updates,
-)
-from .catalog import (
-    CatalogRecord,
-    ensure_catalog_provider_links,
-    ensure_catfile_catalog,
-    ensure_journal_overview,
-    ensure_serfile_catalog,
-    process_catalog,
-    process_catalog_provider_links,
-    process_journal_overview,
-)
-from .client import (
-    count_search_results,
-    get_abstracts,
-    get_abstracts_dict,
-    get_articles,
-    get_articles_dict,
-    get_titles,
-    get_titles_dict,
-    search,
-)
-from .utils import ISSN, Author, Heading, Qualifier
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import (
+        AbstractText,
+        Article,
+        Journal,
+        ensure_baselines,
+        ensure_updates,
+        iterate_ensure_articles,
+        iterate_ensure_baselines,
+        iterate_ensure_updates,
+        iterate_process_articles,
+        iterate_process_baselines,
+        iterate_process_updates,
+        process_articles,
+        process_baselines,
+        process_updates,
+    )
+    from .catalog import (
+        CatalogRecord,
+        ensure_catalog_provider_links,
+        ensure_catfile_catalog,
+        ensure_journal_overview,
+        ensure_serfile_catalog,
+        process_catalog,
+        process_catalog_provider_links,
+        process_journal_overview,
+    )
+    from .client import (
+        count_search_results,
+        get_abstracts,
+        get_abstracts_dict,
+        get_articles,
+        get_articles_dict,
+        get_titles,
+        get_titles_dict,
+        search,
+    )
+    from .utils import ISSN, Author, Heading, Qualifier
 
 __all__ = [
     "ISSN",
@@ -74,3 +78,58 @@ __all__ = [
     "process_updates",
     "search",
 ]
+
+#: Which submodule defines each re-exported name, so importing the
+#: package does not eagerly import lxml, pydantic, requests, etc.
+_SUBMODULES: dict[str, str] = {
+    "AbstractText": "api",
+    "Article": "api",
+    "Journal": "api",
+    "ensure_baselines": "api",
+    "ensure_updates": "api",
+    "iterate_ensure_articles": "api",
+    "iterate_ensure_baselines": "api",
+    "iterate_ensure_updates": "api",
+    "iterate_process_articles": "api",
+    "iterate_process_baselines": "api",
+    "iterate_process_updates": "api",
+    "process_articles": "api",
+    "process_baselines": "api",
+    "process_updates": "api",
+    "CatalogRecord": "catalog",
+    "ensure_catalog_provider_links": "catalog",
+    "ensure_catfile_catalog": "catalog",
+    "ensure_journal_overview": "catalog",
+    "ensure_serfile_catalog": "catalog",
+    "process_catalog": "catalog",
+    "process_catalog_provider_links": "catalog",
+    "process_journal_overview": "catalog",
+    "count_search_results": "client",
+    "get_abstracts": "client",
+    "get_abstracts_dict": "client",
+    "get_articles": "client",
+    "get_articles_dict": "client",
+    "get_titles": "client",
+    "get_titles_dict": "client",
+    "search": "client",
+    "ISSN": "utils",
+    "Author": "utils",
+    "Heading": "utils",
+    "Qualifier": "utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import re-exported names lazily on first access (:pep:`562`)."""
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    # cache so later accesses skip this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily re-exported names."""
+    return sorted(__all__)
@@ -7,17 +7,17 @@ import datetime
 import gzip
 import itertools as itt
 import json
+import re
 from collections.abc import Iterable, Mapping
 from pathlib import Path
-from typing import Any, Literal, TextIO
-from xml.etree.ElementTree import Element
+from typing import Any, Literal, TextIO, cast
 
 import click
 import requests
 import ssslm
-from bs4 import BeautifulSoup
 from curies import Reference
 from lxml import etree
+from lxml.etree import _Element as Element
 from pydantic import BaseModel, Field
 from tqdm import tqdm
 from tqdm.contrib.concurrent import thread_map
@@ -97,7 +97,22 @@ def process_journal_overview(*, force: bool = False, include_entrez: bool = True
     :returns: A list of journal objects parsed from the overview file
     """
     path = ensure_journal_overview(force=force, include_entrez=include_entrez)
-    return list(_parse_journals(path))
+    # validate once on first parse, then reload from a JSONL sidecar
+    # with a single-pass model_validate_json like the article caches
+    cache_path = path.with_suffix(".jsonl.gz")
+    if cache_path.is_file() and not force:
+        with gzip.open(cache_path, mode="rt") as file:
+            return [Journal.model_validate_json(line) for line in file]
+    journals = list(_parse_journals(path))
+    tmp_path = cache_path.with_suffix(".gz.tmp")
+    with gzip.open(tmp_path, mode="wt", compresslevel=3) as file:
+        for journal in journals:
+            # no exclude_none here - start_year/end_year are required
+            # fields that may be None, so dropping them breaks reload
+            file.write(journal.model_dump_json())
+            file.write("\n")
+    tmp_path.rename(cache_path)
+    return journals
 
 
 def ensure_journal_overview(*, force: bool = False, include_entrez: bool = True) -> Path:
@@ -180,6 +195,14 @@ def _iterate_journals(*, force: bool = False) -> Iterable[Journal]:
             yield journal
 
 
+#: Compiled once at import, since find/findall re-resolve their path
+#: expression on every call and these run once per journal
+_ISSNS_XPATH = etree.XPath("Issn")
+_ALIASES_XPATH = etree.XPath("Alias")
+
+_ACTIVE = {"0": False, "1": True}
+
+
 def _process_journal(element: Element) -> Journal | None:
     jrid = element.attrib["jrid"]
 
@@ -187,16 +210,14 @@ def _process_journal(element: Element) -> Journal | None:
     title = element.findtext("Name")
     issns = [
         ISSN(value=issn_tag.text, type=issn_tag.attrib["type"].capitalize())
-        for issn_tag in element.findall("Issn")
+        for issn_tag in _ISSNS_XPATH(element)
     ]
-    match element.findtext("ActivityFlag"):
-        case "0":
-            active = False
-        case "1":
-            active = True
-        case _ as v:
-            raise ValueError(f"unknown activity value: {v}")
-    synonyms = [alias_tag.text for alias_tag in element.findall("Alias")]
+    activity_flag = element.findtext("ActivityFlag")
+    try:
+        active = _ACTIVE[activity_flag]
+    except KeyError:
+        raise ValueError(f"unknown activity value: {activity_flag}") from None
+    synonyms = [alias_tag.text for alias_tag in _ALIASES_XPATH(element)]
     if (start_year := element.findtext("StartYear")) and len(start_year) != 4:
         tqdm.write(f"[{nlm_catalog_id}] invalid start year: {start_year}")
         start_year = None
@@ -315,7 +336,7 @@ def _process_elocation_tag(elt: Element) -> str | None:
         return None
     if elt.attrib["ValidYN"] == "N":
         return None
-    return elt.text
+    return cast("str | None", elt.text)
 
 
 def _extract_alts(tag: Element) -> list[TitleAlternative]:
@@ -738,15 +759,15 @@ def _iter_serfile_urls() -> Iterable[str]:
     )
 
 
+#: The NLM FTP listings are stable Apache index pages, so a regex over
+#: the anchors replaces a full BeautifulSoup parse of each page
+_LISTING_HREF_RE = re.compile(r'href="([^"]+)"')
+
+
 def _iter_catalog_urls(base: str, skip_prefix: str, include_prefix: str) -> Iterable[str]:
     # see https://www.nlm.nih.gov/databases/download/catalog.html
     res = requests.get(base, timeout=300)
-    soup = BeautifulSoup(res.text, "html.parser")
-    for link in soup.find_all("a"):
-        href = link.attrs["href"]
-        if not isinstance(href, str) or not href:
-            tqdm.write(f"link: {link}")
-            continue
+    for href in _LISTING_HREF_RE.findall(res.text):
         if (
             href.startswith(skip_prefix)
             or href.endswith(".marcxml.xml")
@@ -1,9 +1,9 @@
 """Interact with NCBI rest."""
 
+import functools
 import logging
 import os
 import platform
-import shlex
 import stat
 import subprocess
 from collections.abc import Iterable
@@ -33,6 +33,7 @@ __all__ = [
     "get_articles_dict",
     "get_titles",
     "get_titles_dict",
+    "iter_search_with_edirect",
     "search",
     "search_with_api",
     "search_with_edirect",
@@ -100,24 +101,66 @@ def search(query: str, backend: SearchBackend | None = None, **kwargs: Any) -> l
 
 def search_with_edirect(query: str) -> list[str]:
     """Get PubMed identifiers for a query."""
-    injection = f"PATH={get_edirect_directory().as_posix()}:${{PATH}}"
-    cmd = (
-        f"{injection} esearch -db pubmed -query {shlex.quote(query)} "
-        f"| {injection} efetch -format uid"
-    )
-    res = subprocess.getoutput(cmd)  # noqa:S605
-    if "esearch: command not found" in res:
-        raise RuntimeError("esearch is not properly on the filepath")
-    if "efetch: command not found" in res:
-        raise RuntimeError("efetch is not properly on the filepath")
-    # If there are more than 10k IDs, the CLI outputs a . for each
-    # iteration, these have to be filtered out
-    pubmeds = [pubmed for pubmed in res.split("\n") if pubmed and "." not in pubmed]
-    return pubmeds
+    return list(iter_search_with_edirect(query))
+
 
+@functools.cache
+def _edirect_env() -> dict[str, str]:
+    """Get an environment with the edirect tools on the path.
 
+    Cached since copying the full environment per search adds up and
+    the process environment rarely changes mid-run.
+    """
+    env = os.environ.copy()
+    env["PATH"] = f"{get_edirect_directory().as_posix()}{os.pathsep}{env['PATH']}"
+    return env
+
+
+def iter_search_with_edirect(query: str) -> Iterable[str]:
+    """Iterate over PubMed identifiers for a query as efetch emits them."""
+    directory = get_edirect_directory()
+    env = _edirect_env()
+    # pipe esearch into efetch directly instead of building a shell
+    # string, so the query needs no quoting and identifiers stream
+    # through instead of buffering the whole output
+    esearch = subprocess.Popen(  # noqa:S603
+        [str(directory.joinpath("esearch")), "-db", "pubmed", "-query", query],
+        stdout=subprocess.PIPE,
+        env=env,
+    )
+    efetch = subprocess.Popen(  # noqa:S603
+        [str(directory.joinpath("efetch")), "-format", "uid"],
+        stdin=esearch.stdout,
+        stdout=subprocess.PIPE,
+        env=env,
+        text=True,
+    )
+    # close the parent's copy of the pipe so esearch gets SIGPIPE if
+    # efetch exits early
+    if esearch.stdout is not None:
+        esearch.stdout.close()
+    if efetch.stdout is None:
+        raise RuntimeError("could not connect to efetch output")
+    try:
+        # If there are more than 10k IDs, the CLI outputs a . for each
+        # iteration, these have to be filtered out
+        for line in efetch.stdout:
+            if (pubmed := line.strip()) and "." not in pubmed:
+                yield pubmed
+    finally:
+        # reap the pipeline even if the consumer stops early
+        efetch.stdout.close()
+        efetch_returncode = efetch.wait()
+        esearch_returncode = esearch.wait()
+    # only reached on full exhaustion - an abandoned generator exits
+    # through the finally with GeneratorExit instead
+    if efetch_returncode or esearch_returncode:
+        raise RuntimeError(f"edirect search failed for query: {query}")
+
+
+@functools.cache
 def get_edirect_directory() -> Path:
-    """Get path to eSearch tool."""
+    """Get path to eSearch tool, downloading and unpacking it on the first call."""
     path = MODULE.ensure_untar(url=URL)
 
     if platform.system() == "Darwin" and platform.machine() == "arm64":
@@ -130,12 +173,15 @@ def get_edirect_directory() -> Path:
     return path.joinpath("edirect")
 
 
+@functools.cache
 def _ensure_xtract_command(url: str) -> Path:
     path = MODULE.ensure_gunzip("edirect", "edirect", url=url)
 
-    # make sure that the file is executable
-    st = os.stat(path)
-    os.chmod(path, st.st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)  # noqa:S103
+    # make sure that the file is executable, skipping the stat/chmod
+    # pair when the execute bits are already set from a previous run
+    if not os.access(path, os.X_OK):
+        st = os.stat(path)
+        os.chmod(path, st.st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)  # noqa:S103
     return path
 
 
@@ -3,16 +3,17 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import logging
 import re
 from calendar import monthrange
 from collections.abc import Iterable
 from typing import Any, Literal
-from xml.etree.ElementTree import Element
 
 import pystow
 import ssslm
 from curies import NamableReference
+from lxml.etree import _Element as Element
 from pydantic import BaseModel, Field
 from tqdm import tqdm
 
@@ -41,6 +42,14 @@ ORCID_PREFIXES = [
     "http://ORCID.org/",
 ]
 
+#: One compiled alternation over :data:`ORCID_PREFIXES`, so prefix
+#: stripping is a single C-level scan instead of up to thirteen per
+#: identifier. Longest-first ordering keeps ``"https://orcid.org"``
+#: from shadowing its dash- and space-suffixed variants
+_ORCID_PREFIX_RE = re.compile(
+    "|".join(re.escape(prefix) for prefix in sorted(ORCID_PREFIXES, key=len, reverse=True))
+)
+
 
 class ISSN(BaseModel):
     """Represents an ISSN, annotated with its type."""
@@ -53,12 +62,41 @@ def parse_date(date_tag: Element | None) -> datetime.date | None:
     """Parse a date tag, if possible."""
     if date_tag is None:
         return None
-    year_tag = date_tag.find("Year")
-    if year_tag is None or not year_tag.text:
+    # one sweep over the (typically three) children instead of a
+    # findtext scan per part
+    year_text = month_text = day_text = None
+    for child in date_tag:
+        child_tag = child.tag
+        if child_tag == "Year":
+            year_text = child.text
+        elif child_tag == "Month":
+            month_text = child.text
+        elif child_tag == "Day":
+            day_text = child.text
+    if not year_text:
         return None
-    year = int(year_tag.text)
-    month = _get_month(date_tag)
-    day = _get_day(date_tag, year, month)
+    return _parse_date_texts(year_text, month_text, day_text)
+
+
+@functools.lru_cache(maxsize=2**16)
+def _parse_date_texts(
+    year_text: str, month_text: str | None, day_text: str | None
+) -> datetime.date | None:
+    """Parse the text content of a date tag's children.
+
+    The same dates recur thousands of times across a baseline file
+    (e.g., for all articles in an issue), so this pure string part is
+    memoized.
+    """
+    year = int(year_text)
+    month = (_handle_month(month_text) or 1) if month_text else 1
+    if day_text:
+        day = int(day_text)
+        _start, n_days = monthrange(year, month)
+        # sometimes there are issues where date is out of range
+        day = min(day, n_days)
+    else:
+        day = 1
     try:
         rv = datetime.date(year=year, month=month, day=day)
     except ValueError:
@@ -68,24 +106,6 @@ def parse_date(date_tag: Element | None) -> datetime.date | None:
         return rv
 
 
-def _get_month(date_tag: Element) -> int:
-    month_tag = date_tag.find("Month")
-    if month_tag is None or not month_tag.text:
-        return 1  # default
-    return _handle_month(month_tag.text) or 1
-
-
-def _get_day(date_tag: Element, year: int, month: int) -> int:
-    day_tag = date_tag.find("Day")
-    if day_tag is None or not day_tag.text:
-        return 1
-    day = int(day_tag.text)
-    _start, n_days = monthrange(year, month)
-    # sometimes there are issues where date is out of range
-    day = min(day, n_days)
-    return day
-
-
 def _handle_month(month_text: str) -> int | None:
     if month_text.isnumeric():
         return int(month_text)
@@ -149,28 +169,45 @@ STARTS = (
 )
 
 
-def parse_affiliations(tag: Element, ror_grounder: ssslm.Grounder | None) -> list[Organization]:
-    """Parse affiliations from an XML element."""
+@functools.lru_cache(maxsize=2**16)
+def cached_get_best_match(grounder: ssslm.Grounder, text: str) -> ssslm.Match | None:
+    """Get the best match for a text, memoized per grounder.
+
+    Agency, affiliation, and descriptor names recur enormously across
+    the corpus, so grounding becomes a function of the unique strings
+    rather than their occurrences. Grounders hash by identity, and the
+    cache lives for the life of each worker process.
+    """
+    return grounder.get_best_match(text)
+
+
+def _ground_affiliations(
+    affiliation_texts: Iterable[str], ror_grounder: ssslm.Grounder | None
+) -> list[Organization]:
+    """Ground affiliation strings to organizations."""
     organizations = []
-    for affiliation in tag.findall(".//AffiliationInfo/Affiliation"):
-        if not affiliation.text:
-            continue
+    for text in affiliation_texts:
         if ror_grounder is None:
             reference = None
-        elif match := ror_grounder.get_best_match(affiliation.text):
+        elif match := cached_get_best_match(ror_grounder, text):
             reference = match.reference
-        elif annotations_ := ror_grounder.annotate(affiliation.text):
+        elif annotations_ := ror_grounder.annotate(text):
             reference = annotations_[0].reference
         else:
             reference = None
-        organization = Organization(
-            name=affiliation.text,
+        organization = Organization.model_construct(
+            name=text,
             reference=reference,
         )
         organizations.append(organization)
     return organizations
 
 
+#: Tags handled by :func:`parse_author`, excluded from the diagnostic
+#: dump of unexpected children when an author is missing its names
+_AUTHOR_CORE_TAGS = frozenset({"LastName", "ForeName", "Initials", "AffiliationInfo"})
+
+
 def parse_author(  # noqa:C901
     position: int,
     tag: Element,
@@ -180,51 +217,69 @@ def parse_author(  # noqa:C901
     author_grounder: ssslm.Grounder | None,
 ) -> Author | Collective | None:
     """Parse an author XML object."""
-    affiliations = parse_affiliations(tag, ror_grounder=ror_grounder)
-    valid = _parse_yn(tag.attrib["ValidYN"]) if "ValidYN" in tag.attrib else True
+    valid = _parse_yn(valid_text) if (valid_text := tag.get("ValidYN")) else True
 
+    # an <Author> usually has a handful of children, so one sweep picks
+    # everything up instead of six separate find/findall passes
+    last_name_tag = forename_tag = initials_tag = collective_name_tag = None
+    affiliation_texts: list[str] = []
+    roles: list[str] = []
     orcid = None
-    for it in tag.findall("Identifier"):
-        if not it.text:
-            continue
-        source = it.attrib.get("Source")
-        if any(it.text.startswith(uri_prefix) for uri_prefix in STARTS):
-            pass
-        elif source == "FrPBN":
-            pass  # this only happens once FrPBN:17723227, no context available
-        elif source != "ORCID":
-            logger.warning("unhandled identifier source: %s - %s (%s)", source, it.text, it.attrib)
-        else:
-            orcid = _clean_orcid(it.text)
-
-    last_name_tag = tag.find("LastName")
-    forename_tag = tag.find("ForeName")
-    initials_tag = tag.find("Initials")
-    collective_name_tag = tag.find("CollectiveName")
-
-    roles = [role_tag.text for role_tag in tag.findall("Role")]
+    for child in tag:
+        child_tag = child.tag
+        if child_tag == "LastName":
+            last_name_tag = child
+        elif child_tag == "ForeName":
+            forename_tag = child
+        elif child_tag == "Initials":
+            initials_tag = child
+        elif child_tag == "CollectiveName":
+            collective_name_tag = child
+        elif child_tag == "AffiliationInfo":
+            affiliation_texts.extend(
+                affiliation.text
+                for affiliation in child.iterfind("Affiliation")
+                if affiliation.text
+            )
+        elif child_tag == "Role":
+            # an empty <Role/> would smuggle None past model_construct and
+            # poison the serialized cache, so skip it like empty affiliations
+            if child.text:
+                roles.append(child.text)
+        elif child_tag == "Identifier":
+            if not child.text:
+                continue
+            source = child.get("Source")
+            if any(child.text.startswith(uri_prefix) for uri_prefix in STARTS):
+                pass
+            elif source == "FrPBN":
+                pass  # this only happens once FrPBN:17723227, no context available
+            elif source != "ORCID":
+                logger.warning(
+                    "unhandled identifier source: %s - %s (%s)", source, child.text, child.attrib
+                )
+            else:
+                orcid = _clean_orcid(child.text)
+
+    affiliations = _ground_affiliations(affiliation_texts, ror_grounder=ror_grounder)
 
     if collective_name_tag is not None and collective_name_tag.text:
         name = collective_name_tag.text.rstrip(".")
-        match = ror_grounder.get_best_match(name) if ror_grounder is not None else None
-        return Collective(
+        match = cached_get_best_match(ror_grounder, name) if ror_grounder is not None else None
+        return Collective.model_construct(
             position=position, name=name, reference=match.reference if match else None, roles=roles
         )
 
     if last_name_tag is None:
         if orcid is not None:
-            return Author(
+            return Author.model_construct(
                 position=position,
                 valid=valid,
                 affiliations=affiliations,
                 orcid=orcid,
                 roles=roles,
             )
-        remainder = {
-            subtag.tag
-            for subtag in tag
-            if subtag.tag not in {"LastName", "ForeName", "Initials", "AffiliationInfo"}
-        }
+        remainder = {subtag.tag for subtag in tag if subtag.tag not in _AUTHOR_CORE_TAGS}
         logger.warning(f"no last name given in {tag}. Other tags to check: {remainder}")
         return None
 
@@ -234,18 +289,14 @@ def parse_author(  # noqa:C901
         name = f"{initials_tag.text} {last_name_tag.text}"
     else:
         if orcid is not None:
-            return Author(
+            return Author.model_construct(
                 position=position,
                 valid=valid,
                 affiliations=affiliations,
                 orcid=orcid,
                 roles=roles,
             )
-        remainder = {
-            subtag.tag
-            for subtag in tag
-            if subtag.tag not in {"LastName", "ForeName", "Initials", "AffiliationInfo"}
-        }
+        remainder = {subtag.tag for subtag in tag if subtag.tag not in _AUTHOR_CORE_TAGS}
         # TODO can come back to this and do more debugging
         logger.debug(
             f"[{doc_key}] no forename given in {tag} w/ last name {last_name_tag.text}. "
@@ -256,11 +307,11 @@ def parse_author(  # noqa:C901
     if (
         orcid is None
         and author_grounder
-        and (best_orcid_match := author_grounder.get_best_match(name))
+        and (best_orcid_match := cached_get_best_match(author_grounder, name))
     ):
         orcid = best_orcid_match.identifier
 
-    return Author(
+    return Author.model_construct(
         position=position,
         valid=valid,
         name=name,
@@ -305,7 +356,7 @@ def parse_mesh_heading(
         return None
     elif descriptor_name and not descriptor_mesh_id:
         best_match = (
-            mesh_grounder.get_best_match(descriptor_name.rstrip("."))
+            cached_get_best_match(mesh_grounder, descriptor_name.rstrip("."))
             if mesh_grounder is not None
             else None
         )
@@ -320,24 +371,31 @@ def parse_mesh_heading(
         raise NotImplementedError("need to lookup descriptor MeSH name automatically")
     # else, name and MeSH ID both available, and all good to continue
 
+    # every branch above either returned, raised, or assigned an identifier
+    if descriptor_mesh_id is None:
+        raise ValueError("mesh descriptor unexpectedly missing an identifier")
+
     major = _parse_yn(descriptor_name_tag.attrib["MajorTopicYN"])
-    qualifiers = []
+    # most headings have no qualifiers, so only allocate the list on the
+    # first hit instead of building an empty one to discard below
+    qualifiers = None
     # FIXME is this supposed to look in tag or descriptor_name_tag
-    for qualifier_tag in mesh_heading_tag.findall("QualifierName"):
-        qualifier_mesh_id = qualifier_tag.attrib.get("UI")
-        qualifiers.append(
-            Qualifier(
-                name=qualifier_tag.text,
-                mesh_id=qualifier_mesh_id,
-                major=_parse_yn(qualifier_tag.attrib["MajorTopicYN"]),
-            )
+    for qualifier_tag in mesh_heading_tag.iterfind("QualifierName"):
+        qualifier = Qualifier.model_construct(
+            name=qualifier_tag.text,
+            mesh_id=qualifier_tag.get("UI"),
+            major=_parse_yn(qualifier_tag.attrib["MajorTopicYN"]),
         )
+        if qualifiers is None:
+            qualifiers = [qualifier]
+        else:
+            qualifiers.append(qualifier)
 
-    return Heading(
+    return Heading.model_construct(
         mesh_id=descriptor_mesh_id,
         name=descriptor_name,
         major=major,
-        qualifiers=qualifiers or None,
+        qualifiers=qualifiers,
     )
 
 
@@ -347,32 +405,34 @@ MESH_RDF_URI_PREFIX = "https://id.nlm.nih.gov/mesh/"
 def _get_mesh_id(
     descriptor_name_tag: Element, mesh_heading_tag: Element | None = None
 ) -> str | None:
+    # the str() wraps narrow lxml's untyped attribute lookups for mypy
     if "UI" in descriptor_name_tag.attrib:
-        return descriptor_name_tag.attrib["UI"].removeprefix(MESH_RDF_URI_PREFIX)
+        return str(descriptor_name_tag.attrib["UI"]).removeprefix(MESH_RDF_URI_PREFIX)
     if "URI" in descriptor_name_tag.attrib:
-        return descriptor_name_tag.attrib["URI"].removeprefix(MESH_RDF_URI_PREFIX)
+        return str(descriptor_name_tag.attrib["URI"]).removeprefix(MESH_RDF_URI_PREFIX)
     if mesh_heading_tag is not None and "URI" in mesh_heading_tag.attrib:
-        return mesh_heading_tag.attrib["URI"].removeprefix(MESH_RDF_URI_PREFIX)
+        return str(mesh_heading_tag.attrib["URI"]).removeprefix(MESH_RDF_URI_PREFIX)
     return None
 
 
+_YN = {"Y": True, "N": False}
+
+
 def _parse_yn(s: str) -> bool:
-    match s:
-        case "Y":
-            return True
-        case "N":
-            return False
-        case _:
-            raise ValueError(s)
+    # a dict hit is a single hash lookup, cheaper than a match/case
+    # comparison chain on a function called several times per heading
+    try:
+        return _YN[s]
+    except KeyError:
+        raise ValueError(s) from None
 
 
 SPLOOSHED_RE = re.compile(r"^\d{15}(\d|X)$")
 
 
 def _clean_orcid(s: str) -> str | None:
-    for p in ORCID_PREFIXES:
-        if s.startswith(p):
-            return s[len(p) :]
+    if prefix_match := _ORCID_PREFIX_RE.match(s):
+        return s[prefix_match.end() :]
     if len(s) == 19:
         return s
     elif len(s) == 18:
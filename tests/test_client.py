@@ -7,7 +7,7 @@ from pathlib import Path
 from lxml import etree
 
 from pubmed_downloader import Author
-from pubmed_downloader.api import Grant, History, _extract_article
+from pubmed_downloader.api import Article, Grant, History, _extract_article
 from pubmed_downloader.client import (
     get_abstracts,
     get_edirect_directory,
@@ -127,3 +127,19 @@ class TestEDirect(unittest.TestCase):
             Grant(id="R24 OD011883", acronym="OD", agency="NIH HHS", country="United States"),
             article.grants,
         )
+
+    def test_round_trip(self) -> None:
+        """Test a parsed article survives a serialization round trip.
+
+        The hot parse path constructs models with ``model_construct``,
+        so re-validating the dump catches any field-name drift.
+        """
+        root = etree.parse(SAMPLE_PATH)
+        article_element = root.find("PubmedArticle")
+        article = _extract_article(
+            article_element, ror_grounder=None, mesh_grounder=None, author_grounder=None
+        )
+        if article is None:
+            raise ValueError
+        reloaded = Article.model_validate_json(article.model_dump_json())
+        self.assertEqual(article, reloaded)